@@ -1,58 +1,69 @@
-import json
 import logging
+from functools import lru_cache
 from pathlib import Path
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 # Get path relative to project root (parent of src/)
 PROJECT_ROOT = Path(__file__).parent.parent
 COOKIES_PATH = PROJECT_ROOT / "secrets" / "cookies.json"
 
+# Browser-export sameSite values mapped to the casing Playwright expects
+_SAMESITE_MAP = {
+    "unspecified": "Lax",
+    "no_restriction": "None",
+    "lax": "Lax",
+    "strict": "Strict",
+    "none": "None",
+    "Lax": "Lax",
+    "Strict": "Strict",
+    "None": "None",
+}
+
 
 def load_cookies() -> list[dict]:
     """Load and format cookies from JSON file for Playwright.
 
+    The formatted cookies are cached until the cookie file changes on disk.
+
     Returns:
         List of cookies formatted for Playwright's add_cookies method.
         Each cookie must have sameSite as one of: "Strict", "Lax", or "None"
     """
     try:
-        with open(str(COOKIES_PATH), "r") as f:
-            cookies = json.load(f)
-
-        # Format cookies for Playwright
-        formatted_cookies = []
-        for cookie in cookies:
-            # Convert sameSite to proper format and case
-            same_site = cookie.get("sameSite", "Lax")
-            if same_site == "unspecified":
-                same_site = "Lax"
-            elif same_site == "no_restriction":
-                same_site = "None"
-            elif same_site == "lax":
-                same_site = "Lax"
-            elif same_site == "strict":
-                same_site = "Strict"
-            elif same_site == "none":
-                same_site = "None"
-
-            formatted_cookie = {
-                "name": cookie["name"],
-                "value": cookie["value"],
-                "domain": cookie["domain"],
-                "path": cookie["path"],
-                "sameSite": same_site,
-                "secure": cookie.get("secure", False),
-                "httpOnly": cookie.get("httpOnly", False),
-            }
-
-            # Add expiration if present
-            if "expirationDate" in cookie:
-                formatted_cookie["expires"] = cookie["expirationDate"]
-
-            formatted_cookies.append(formatted_cookie)
-
-        return formatted_cookies
+        return _load_formatted_cookies(COOKIES_PATH.stat().st_mtime_ns)
     except Exception as e:
         logger.error(f"Failed to load cookies: {e}")
         return []
+
+
+@lru_cache(maxsize=1)
+def _load_formatted_cookies(mtime_ns: int) -> list[dict]:
+    """Read and format the cookie file. `mtime_ns` keys the cache to the file version."""
+    with open(str(COOKIES_PATH), "rb") as f:
+        cookies = orjson.loads(f.read())
+
+    # Format cookies for Playwright
+    formatted_cookies = []
+    for cookie in cookies:
+        same_site = _SAMESITE_MAP.get(cookie.get("sameSite", "Lax"), "Lax")
+
+        formatted_cookie = {
+            "name": cookie["name"],
+            "value": cookie["value"],
+            "domain": cookie["domain"],
+            "path": cookie["path"],
+            "sameSite": same_site,
+            "secure": cookie.get("secure", False),
+            "httpOnly": cookie.get("httpOnly", False),
+        }
+
+        # Add expiration if present
+        if "expirationDate" in cookie:
+            formatted_cookie["expires"] = cookie["expirationDate"]
+
+        formatted_cookies.append(formatted_cookie)
+
+    return formatted_cookies
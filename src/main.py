@@ -1,3 +1,4 @@
+import atexit
 import logging
 import re
 from contextlib import contextmanager
@@ -5,13 +6,13 @@ from datetime import datetime
 from pathlib import Path
 
 import requests
-from playwright.sync_api import sync_playwright
+from playwright.sync_api import Browser, Playwright, sync_playwright
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
 from auth import load_cookies
 from solver import GameMode, solve_wordle
 from values import TELEGRAM_CHAT_ID, TELEGRAM_TOKEN
 
-logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
 # Get path relative to project root (parent of src/)
@@ -22,15 +23,66 @@ MODE = "REAL"
 WAIT_FOR_LOAD_TIME_MS = 3000
 WAIT_FOR_LOAD_TIME_MS_LONG = 10000
 
+_STATS_PATTERNS = {
+    "played": re.compile(r"Number of games played, (\d+)"),
+    "win_percentage": re.compile(r"Win percentage, (\d+)"),
+    "current_streak": re.compile(r"Current Streak count, (\d+)"),
+    "max_streak": re.compile(r"Max Streak count, (\d+)"),
+}
+
+# Counts the Play/Continue buttons (by data-testid) in a single round-trip
+_COUNT_GAME_MODE_BUTTONS_JS = """
+(testIds) => testIds.map((id) => document.querySelectorAll(`[data-testid="${id}"]`).length)
+"""
+
+
+def _launch_chromium(playwright: Playwright) -> Browser:
+    return playwright.chromium.launch(headless=MODE != "TEST")
+
 
 @contextmanager
 def playwright_context():
     with sync_playwright() as p:
-        browser = p.chromium.launch(headless=False if MODE == "TEST" else True)
+        browser = _launch_chromium(p)
         yield browser
         browser.close()
 
 
+def launch_browser() -> Browser:
+    """Launch a browser that is reused across checks and closed when the process exits."""
+    playwright = sync_playwright().start()
+    try:
+        browser = _launch_chromium(playwright)
+    except Exception:
+        # Stop the driver so a later one-off sync_playwright() can start in this thread
+        playwright.stop()
+        raise
+
+    def _shutdown() -> None:
+        if browser.is_connected():
+            browser.close()
+        playwright.stop()
+
+    atexit.register(_shutdown)
+    return browser
+
+
+@contextmanager
+def browser_context(browser: Browser | None = None):
+    """Yield a fresh BrowserContext on `browser`, or on a one-off browser if none is usable."""
+    if browser is None or not browser.is_connected():
+        with playwright_context() as one_off_browser:
+            context = one_off_browser.new_context()
+            yield context
+        return
+
+    context = browser.new_context()
+    try:
+        yield context
+    finally:
+        context.close()
+
+
 def send_telegram_alert(message: str):
     """Send notification message to Telegram"""
     message = f"🚨 {message} 🚨"
@@ -56,16 +108,11 @@ def dump_page_content_to_file(page) -> None:
 
 def get_wordle_stats(page) -> dict[str, int]:
     html = page.content()
-    patterns = {
-        "played": r"Number of games played, (\d+)",
-        "win_percentage": r"Win percentage, (\d+)",
-        "current_streak": r"Current Streak count, (\d+)",
-        "max_streak": r"Max Streak count, (\d+)",
-    }
-    return {
-        key: int(re.search(pattern, html).group(1)) if re.search(pattern, html) else None
-        for key, pattern in patterns.items()
-    }
+    stats = {}
+    for key, pattern in _STATS_PATTERNS.items():
+        match = pattern.search(html)
+        stats[key] = int(match.group(1)) if match else None
+    return stats
 
 
 def open_stats_panel(page) -> dict[str, int]:
@@ -84,17 +131,29 @@ def open_stats_panel(page) -> dict[str, int]:
     page.wait_for_timeout(WAIT_FOR_LOAD_TIME_MS)
 
 
+def wait_for_game_screen(page) -> None:
+    """Wait until the welcome screen (Play/Continue) or the finished-game screen has rendered."""
+    game_screen = (
+        page.get_by_test_id(GameMode.PLAY.value)
+        .or_(page.get_by_test_id(GameMode.CONTINUE.value))
+        .or_(page.get_by_test_id("Admire Puzzle"))
+        .or_(page.get_by_role("button", name="Admire Puzzle"))
+    )
+    try:
+        game_screen.first.wait_for(timeout=WAIT_FOR_LOAD_TIME_MS_LONG)
+    except PlaywrightTimeoutError:
+        logger.warning("Game screen did not render in time")
+
+
 def _is_late_night() -> bool:
     return datetime.now().hour > 22
 
 
-def check_wordle_status() -> dict[str, bool]:
-    """Check if today's Wordle has been played."""
+def check_wordle_status(browser: Browser | None = None) -> dict[str, bool]:
+    """Check if today's Wordle has been played. Reuses `browser` if given, else launches one."""
     logger.info(f"Starting Wordle check at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
-    with playwright_context() as browser:
-        context = browser.new_context()
-        # context = browser.new_context(storage_state="secrets/auth.json")
+    with browser_context(browser) as context:
         page = context.new_page()
 
         # Load and set cookies before navigating
@@ -103,10 +162,11 @@ def check_wordle_status() -> dict[str, bool]:
         logger.info("Loaded cookies for authentication")
 
         page.goto(WORDLE_URL, timeout=WAIT_FOR_LOAD_TIME_MS_LONG)
-        page.wait_for_timeout(10000)  # Pause to load the page
+        wait_for_game_screen(page)
 
-        play_button = page.get_by_test_id(GameMode.PLAY.value).count()
-        continue_button = page.get_by_test_id(GameMode.CONTINUE.value).count()
+        play_button, continue_button = page.evaluate(
+            _COUNT_GAME_MODE_BUTTONS_JS, [GameMode.PLAY.value, GameMode.CONTINUE.value]
+        )
 
         if play_button:
             logger.info("Game is not played today")
@@ -135,16 +195,15 @@ def check_wordle_status() -> dict[str, bool]:
     return {"played_today": has_finished}
 
 
-def play_wordle_incognito() -> None:
+def play_wordle_incognito(browser: Browser | None = None) -> None:
     """Play Wordle in incognito mode (no cookies) and report pass/fail via Telegram."""
     logger.info(f"Starting incognito Wordle play at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
-    with playwright_context() as browser:
-        context = browser.new_context()
+    with browser_context(browser) as context:
         page = context.new_page()
 
         page.goto(WORDLE_URL, timeout=WAIT_FOR_LOAD_TIME_MS_LONG)
-        page.wait_for_timeout(10000)
+        wait_for_game_screen(page)
 
         try:
             score = solve_wordle(page, GameMode.PLAY)
@@ -156,4 +215,5 @@ def play_wordle_incognito() -> None:
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
     result = play_wordle_incognito()
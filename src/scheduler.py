@@ -2,34 +2,50 @@ import logging
 import time
 
 import schedule
+from playwright.sync_api import Browser
 
-from main import check_wordle_status, play_wordle_incognito
+from main import check_wordle_status, launch_browser, play_wordle_incognito
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
+MAX_SLEEP_SECONDS = 300
 
-def _check_wordle_status():
+
+def _check_wordle_status(browser: Browser | None):
     try:
-        check_wordle_status()
+        check_wordle_status(browser)
     except Exception as e:
         logger.exception(e)
 
 
-def _play_wordle_incognito():
+def _play_wordle_incognito(browser: Browser | None):
     try:
-        play_wordle_incognito()
+        play_wordle_incognito(browser)
     except Exception as e:
         logger.exception(e)
 
 
 if __name__ == "__main__":
+    # One browser for the lifetime of the daemon; each check gets its own context.
+    # If it fails to launch, jobs fall back to launching a one-off browser per run.
+    try:
+        browser = launch_browser()
+    except Exception:
+        logger.exception("Failed to launch browser, falling back to a one-off browser per run")
+        browser = None
     times = ["10:00", "17:00", "20:00", "22:30", "23:30"]
     for _time in times:
-        schedule.every().day.at(_time).do(_check_wordle_status)
-    schedule.every().day.at("10:00").do(_play_wordle_incognito)
+        schedule.every().day.at(_time).do(_check_wordle_status, browser)
+    schedule.every().day.at("10:00").do(_play_wordle_incognito, browser)
     logger.info("Init scheduler!")
     logger.info(f"⏰ {schedule.get_jobs()}")
+    # Sleep until the next job instead of polling every second. Each sleep is capped so the
+    # wall clock is rechecked regularly (DST changes, suspend, clock adjustments).
     while True:
+        idle_seconds = schedule.idle_seconds()
+        if idle_seconds is None:
+            break
+        if idle_seconds > 0:
+            time.sleep(min(idle_seconds, MAX_SLEEP_SECONDS))
         schedule.run_pending()
-        time.sleep(1)
@@ -1,18 +1,68 @@
 import logging
+import re
+import string
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from time import sleep
 
+import numpy as np
 import pandas as pd
-from bs4 import BeautifulSoup
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
-logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
 # Get path relative to project root (parent of src/)
 PROJECT_ROOT = Path(__file__).parent.parent
-WORDLE_WORDS = pd.read_csv(PROJECT_ROOT / "wordle-answers.csv")
+WORDLE_WORDS = pd.read_csv(PROJECT_ROOT / "wordle-answers.csv", engine="pyarrow")
+_ALPHABET = frozenset(string.ascii_lowercase)
+
+
+def _letter_bits(letters: str | set[str]) -> int:
+    """Bitmask with bit (ord(letter) - 97) set for each letter.
+
+    Raises:
+        ValueError: If any letter is not lowercase a-z
+    """
+    letters = set(letters)
+    if not letters <= _ALPHABET:
+        raise ValueError(f"Letters must be lowercase a-z, got {sorted(letters - _ALPHABET)}")
+    return sum(1 << (ord(c) - 97) for c in letters)
+
+
+# Precomputed word layouts for vectorized filtering:
+# (N, 5) array of letters by position, (N, 26) 5-bit "positions of letter" masks,
+# and a per-word "contains letter" bitmask
+_FREQUENCIES = WORDLE_WORDS["frequency"].to_numpy()
+_WORDS_ARR = np.array([list(word[:5]) for word in WORDLE_WORDS["word"]])
+_LETTER_POS_BITS = np.zeros((len(WORDLE_WORDS), 26), dtype=np.uint8)
+for _pos in range(5):
+    # Viewing the <U1 letters as int32 gives their code points
+    np.bitwise_or.at(
+        _LETTER_POS_BITS,
+        (np.arange(len(WORDLE_WORDS)), _WORDS_ARR[:, _pos].view(np.int32) - 97),
+        1 << _pos,
+    )
+_WORD_BITS = np.fromiter((_letter_bits(word) for word in WORDLE_WORDS["word"]), dtype=np.uint32)
+
+WAIT_FOR_GUESS_TIME_MS = 5000
+WAIT_FOR_MODAL_TIME_MS = 3000
+
+# A board tile whose letter has been scored and whose flip animation has finished
+_EVALUATED_TILE_SELECTOR = (
+    '[data-testid="tile"][data-animation="idle"]'
+    ':is([data-state="correct"], [data-state="present"], [data-state="absent"])'
+)
+
+# Start of one board row; each row's tiles are read between its start and the next row's
+_ROW_RE = re.compile(r'<div[^>]*\bclass="[^"]*\bRow-module_row__pwpBq\b', re.IGNORECASE)
+
+# Matches one tile (data-testid="tile"), capturing its data-state and inner HTML
+_TILE_RE = re.compile(
+    r'<div(?=[^>]*\bdata-testid="tile")[^>]*\bdata-state="([^"]*)"[^>]*>(.*?)</div>',
+    re.IGNORECASE | re.DOTALL,
+)
+_TAG_RE = re.compile(r"<[^>]*>")
 
 
 class GameMode(Enum):
@@ -33,20 +83,71 @@ class GuessNumber(Enum):
     SIXTH = 6
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Tile:
     pos: int
     letter: str
     state: str
 
 
+@dataclass(slots=True, frozen=True)
+class Guess:
+    """A scored guess with the constraints it implies, precomputed once for filtering."""
+
+    word: str
+    states: tuple[str, ...]
+    correct_positions: tuple[tuple[int, str], ...]  # (position, letter) pairs
+    present_letters: frozenset[str]
+    absent_letters: frozenset[str]
+    wrong_positions: tuple[tuple[str, int], ...]  # (letter, 5-bit mask of positions it is not at) pairs
+
+    @classmethod
+    def from_tiles(cls, tiles: list[Tile]) -> "Guess":
+        """Build a Guess from the tiles of one board row."""
+        correct_positions = {}
+        present_letters = set()
+        absent_letters = set()
+        wrong_positions = {}
+        for tile in tiles:
+            letter, pos, state = tile.letter, tile.pos - 1, tile.state
+            if state == "correct":
+                correct_positions[pos] = letter
+            elif state == "present":
+                present_letters.add(letter)
+                wrong_positions[letter] = wrong_positions.get(letter, 0) | (1 << pos)
+            elif state == "absent":
+                absent_letters.add(letter)
+
+        return cls(
+            word="".join(tile.letter for tile in tiles),
+            states=tuple(tile.state for tile in tiles),
+            correct_positions=tuple(correct_positions.items()),
+            present_letters=frozenset(present_letters),
+            absent_letters=frozenset(absent_letters),
+            wrong_positions=tuple(wrong_positions.items()),
+        )
+
+
 @dataclass
 class WordleState:
-    """Represents the state of a Wordle game."""
+    """Represents the state of a Wordle game.
+
+    Change guesses only through the constructor or set_guess, which keep the derived state
+    (parsed_guesses, solved) in sync; writing to the guesses dict directly is not seen by the filter.
+    """
 
     guesses: dict[GuessNumber, list[Tile] | None] = field(
         default_factory=lambda: {num: None for num in GuessNumber}
     )
+    parsed_guesses: dict[GuessNumber, Guess | None] = field(
+        default_factory=lambda: {num: None for num in GuessNumber}, init=False, repr=False
+    )
+    _solved: bool = field(default=False, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Route guesses passed to the constructor through set_guess so derived state is built
+        for guess_num, tiles in list(self.guesses.items()):
+            self.set_guess(guess_num, tiles)
 
     def get_guess(self, guess_num: GuessNumber) -> list[Tile] | None:
         """Get the tiles for a specific guess number."""
@@ -55,14 +156,20 @@ class WordleState:
     def set_guess(self, guess_num: GuessNumber, tiles: list[Tile] | None) -> None:
         """Set the tiles for a specific guess number."""
         self.guesses[guess_num] = tiles
+        self.parsed_guesses[guess_num] = Guess.from_tiles(tiles) if tiles else None
+        if tiles is not None and all(tile.state == "correct" for tile in tiles):
+            self._solved = True
+        elif self._solved:
+            # The overwritten row may have been the solved one, so rescan
+            self._solved = any(
+                guess is not None and all(tile.state == "correct" for tile in guess)
+                for guess in self.guesses.values()
+            )
 
     @property
     def solved(self) -> bool:
         """Check if the game is solved (any guess has all correct tiles)."""
-        return any(
-            guess is not None and all(tile.state == "correct" for tile in guess)
-            for guess in self.guesses.values()
-        )
+        return self._solved
 
     @property
     def unsolved(self) -> bool:
@@ -80,107 +187,107 @@ class WordleState:
         return self.num_guesses >= 6
 
 
-def guess_word(page, word: str):
-    for char in word:
-        page.keyboard.type(char, delay=100)
+def guess_word(page, word: str, guess_num: int):
+    page.keyboard.type(word)
     page.keyboard.press("Enter")
-    sleep(2)
+
+    # Wait until all five tiles of this row have been revealed; keys are dropped mid-animation
+    row = page.locator("div.Row-module_row__pwpBq").nth(guess_num - 1)
+    try:
+        row.locator(_EVALUATED_TILE_SELECTOR).nth(4).wait_for(timeout=WAIT_FOR_GUESS_TIME_MS)
+    except PlaywrightTimeoutError:
+        logger.warning(f"Guess {guess_num} ({word}) was not revealed in time")
 
 
-def parse_wordle_tiles(html: str, wordle_state: WordleState) -> WordleState:
-    soup = BeautifulSoup(html, "html.parser")
-    rows = soup.find_all("div", {"class": "Row-module_row__pwpBq"})
+def parse_wordle_tiles(html: str, wordle_state: WordleState, start_row: int = 0) -> WordleState:
+    """Parse board tiles into wordle_state, skipping rows before start_row (already parsed)."""
+    row_starts = [match.start() for match in _ROW_RE.finditer(html)][: len(GuessNumber)]
+    row_ends = row_starts[1:] + [len(html)]
 
-    for idx, row in enumerate(rows):
-        tiles = row.find_all("div", {"data-testid": "tile"})
+    for idx in range(start_row, len(row_starts)):
+        # Only the first five tiles belong to the row (the last block runs to the end of the page)
+        row = _TILE_RE.findall(html, row_starts[idx], row_ends[idx])[:5]
         guess = []
-        for i, tile in enumerate(tiles):
-            letter = tile.text.lower()
-            state = tile.get("data-state")
+        for i, (state, inner_html) in enumerate(row):
             if state and state != "empty":
-                tile = Tile(pos=i + 1, letter=letter, state=state)
-                guess.append(tile)
+                letter = _TAG_RE.sub("", inner_html).strip().lower()
+                guess.append(Tile(pos=i + 1, letter=letter, state=state))
         if guess:
             wordle_state.set_guess(GuessNumber(idx + 1), guess)
 
     return wordle_state
 
 
-def filter_possible_words(wordle_state: WordleState) -> list[str]:
-    """Filter possible words based on all guesses in the WordleState."""
-    # Collect all guesses
-    guesses = [wordle_state.get_guess(num) for num in GuessNumber]
-
-    # If no guesses have been made, return all words
-    if not any(guesses):
-        return WORDLE_WORDS
+def filter_possible_words(wordle_state: WordleState) -> tuple[int, str | None]:
+    """Filter possible words based on all guesses in the WordleState.
 
+    Returns:
+        Tuple of (number of valid words, highest-frequency valid word or None if there are none)
+    """
     correct_pos = {}
     present_letters = set()
     absent_letters = set()
     wrong_pos = {}
     guessed_words = set()
 
-    # Process each guess
-    for guess in guesses:
-        if not guess:
+    # Combine the precomputed constraints of each guess (dict is in GuessNumber order)
+    for guess in wordle_state.parsed_guesses.values():
+        if guess is None:
             continue
 
-        # Collect the guessed word
-        guessed_word = "".join(tile.letter for tile in guess)
-        guessed_words.add(guessed_word)
-
-        for tile in guess:
-            letter, pos, state = tile.letter, tile.pos - 1, tile.state
-            if state == "correct":
-                correct_pos[pos] = letter
-            elif state == "present":
-                present_letters.add(letter)
-                wrong_pos.setdefault(letter, set()).add(pos)
-            elif state == "absent":
-                absent_letters.add(letter)
+        guessed_words.add(guess.word)
+        correct_pos.update(guess.correct_positions)
+        present_letters |= guess.present_letters
+        absent_letters |= guess.absent_letters
+        for letter, bad_positions in guess.wrong_positions:
+            wrong_pos[letter] = wrong_pos.get(letter, 0) | bad_positions
 
-    def is_valid(word: str) -> bool:
-        # Skip words that have already been guessed
-        if word in guessed_words:
-            return False
+    mask = ~WORDLE_WORDS["word"].isin(guessed_words).to_numpy()
 
-        # Check correct positions
-        for pos, letter in correct_pos.items():
-            if word[pos] != letter:
-                return False
+    # Check correct positions
+    for pos, letter in correct_pos.items():
+        mask &= _WORDS_ARR[:, pos] == letter
 
-        # Check present letters and their wrong positions
-        for letter, bad_positions in wrong_pos.items():
-            if letter not in word:
-                return False
-            if any(word[pos] == letter for pos in bad_positions):
-                return False
+    # Check present letters are in the word, but not at their wrong positions
+    present_bits = _letter_bits(present_letters)
+    mask &= (_WORD_BITS & present_bits) == present_bits
+    for letter, bad_positions in wrong_pos.items():
+        mask &= (_LETTER_POS_BITS[:, ord(letter) - 97] & bad_positions) == 0
 
-        # Check that all present letters are in the word
-        if not present_letters.issubset(set(word)):
-            return False
+    # Check absent letters
+    absent_bits = _letter_bits(absent_letters - present_letters - set(correct_pos.values()))
+    mask &= (_WORD_BITS & absent_bits) == 0
 
-        # Check absent letters
-        for letter in absent_letters:
-            if letter in word and letter not in present_letters and letter not in correct_pos.values():
-                return False
+    # Pick the highest-frequency valid word without sorting the candidates
+    candidates = np.flatnonzero(mask)
+    if len(candidates) == 0:
+        return 0, None
 
-        return True
+    if logger.isEnabledFor(logging.DEBUG):
+        top_words = WORDLE_WORDS.iloc[candidates].sort_values("frequency", ascending=False)
+        logger.debug(f"Top candidates:\n{top_words.head(10)}")
 
-    # Filter words and sort by frequency
-    valid_words = WORDLE_WORDS[WORDLE_WORDS["word"].apply(is_valid)]
-    return valid_words.sort_values("frequency", ascending=False)
+    best_idx = candidates[np.argmax(_FREQUENCIES[candidates])]
+    return len(candidates), WORDLE_WORDS["word"].iat[best_idx]
 
 
 def solve_wordle(page, mode: GameMode) -> int:
-    # close cookies if present
-    has_close_cookie_banner = page.get_by_role("button", name="Reject all").count()
+    # close cookies if present; the consent banner can render after the game screen
+    reject_button = page.get_by_role("button", name="Reject all")
+    try:
+        reject_button.wait_for(timeout=WAIT_FOR_MODAL_TIME_MS)
+        has_close_cookie_banner = True
+    except PlaywrightTimeoutError:
+        has_close_cookie_banner = False
     if has_close_cookie_banner:
-        page.get_by_role("button", name="Reject all").click()
+        reject_button.click()
         page.get_by_test_id(mode.value).click()
-        page.get_by_role("button", name="Close").click()
-        page.wait_for_timeout(1000)
+        close_button = page.get_by_role("button", name="Close")
+        close_button.click()
+        try:
+            close_button.wait_for(state="hidden", timeout=WAIT_FOR_MODAL_TIME_MS)
+        except PlaywrightTimeoutError:
+            logger.warning("Help modal did not close in time")
 
     wordle_state = WordleState()
 
@@ -196,7 +303,7 @@ def solve_wordle(page, mode: GameMode) -> int:
     else:
         # Start new game with "trace"
         first_guess = "trace"
-        guess_word(page, first_guess)
+        guess_word(page, first_guess, GuessNumber.FIRST.value)
         wordle_state = parse_wordle_tiles(page.content(), wordle_state)
         logger.debug(f"First guess: {first_guess}")
         logger.debug(wordle_state)
@@ -204,18 +311,18 @@ def solve_wordle(page, mode: GameMode) -> int:
 
     # Continue guessing until we win or run out of guesses
     for guess_num in range(start_guess.value, 7):
-        filtered_words = filter_possible_words(wordle_state)
-        logger.debug(f"Filtered {len(filtered_words)} words")
+        num_words, next_guess = filter_possible_words(wordle_state)
+        logger.debug(f"Filtered {num_words} words")
 
-        if len(filtered_words) == 0:
+        if num_words == 0:
             logger.error("No valid words found!")
             raise RuntimeError("No valid words found!")
 
-        next_guess = filtered_words.iloc[0]["word"]
         logger.debug(f"Guess {guess_num}: {next_guess}")
-        guess_word(page, next_guess)
+        guess_word(page, next_guess, guess_num)
 
-        wordle_state = parse_wordle_tiles(page.content(), wordle_state)
+        # Earlier rows are already in wordle_state, only parse the new one
+        wordle_state = parse_wordle_tiles(page.content(), wordle_state, start_row=guess_num - 1)
         logger.debug(wordle_state)
 
         # Check if we won (all tiles in the last guess are correct)
@@ -238,13 +345,19 @@ def solve_wordle_for_target(target_word: str, first_guess: str = "trace") -> Wor
         WordleState with all guesses and their results
 
     Raises:
-        ValueError: If target_word is not 5 letters
+        ValueError: If target_word or first_guess is not 5 letters a-z
         RuntimeError: If unable to solve in 6 guesses
     """
     if len(target_word) != 5:
         raise ValueError(f"Target word must be 5 letters, got {len(target_word)}")
+    if len(first_guess) != 5:
+        raise ValueError(f"First guess must be 5 letters, got {len(first_guess)}")
 
     target_word = target_word.lower()
+    first_guess = first_guess.lower()
+    for word in (target_word, first_guess):
+        if not set(word) <= _ALPHABET:
+            raise ValueError(f"Words must only contain letters a-z, got '{word}'")
     wordle_state = WordleState()
 
     # Make first guess
@@ -253,13 +366,16 @@ def solve_wordle_for_target(target_word: str, first_guess: str = "trace") -> Wor
 
     # Continue guessing until we win or run out of guesses
     for guess_num in range(2, 7):
-        filtered_words = filter_possible_words(wordle_state)
+        if guess_num == 2:
+            feedback = tuple(tile.state for tile in first_tiles)
+            num_words, next_guess = _best_word_after_first_guess(first_guess, feedback)
+        else:
+            num_words, next_guess = filter_possible_words(wordle_state)
 
-        if len(filtered_words) == 0:
+        if num_words == 0:
             logger.warning("No valid words found!")
             return wordle_state
 
-        next_guess = filtered_words.iloc[0]["word"]
         next_tiles = _evaluate_guess(next_guess, target_word)
         wordle_state.set_guess(GuessNumber(guess_num), next_tiles)
 
@@ -272,6 +388,21 @@ def solve_wordle_for_target(target_word: str, first_guess: str = "trace") -> Wor
     return wordle_state
 
 
+@lru_cache(maxsize=243)
+def _best_word_after_first_guess(first_guess: str, feedback: tuple[str, ...]) -> tuple[int, str | None]:
+    """Filter result after only `first_guess`, which depends on its feedback but not the target.
+
+    Cached per feedback pattern (3^5 = 243), so sweeping many targets filters the second guess once each.
+    """
+    wordle_state = WordleState()
+    tiles = [
+        Tile(pos=i + 1, letter=letter, state=state)
+        for i, (letter, state) in enumerate(zip(first_guess, feedback))
+    ]
+    wordle_state.set_guess(GuessNumber.FIRST, tiles)
+    return filter_possible_words(wordle_state)
+
+
 def _evaluate_guess(guess: str, target: str) -> list[Tile]:
     """Evaluate a guess against a target word and return the tile states.
 
@@ -282,25 +413,28 @@ def _evaluate_guess(guess: str, target: str) -> list[Tile]:
     Returns:
         List of Tile objects representing the guess result
     """
-    tiles = []
-    target_letters = list(target)
-    guess_letters = list(guess)
+    # Unmatched occurrences of each letter (a-z) in the target
+    counts = [0] * 26
+    for target_letter in target:
+        counts[ord(target_letter) - 97] += 1
 
     # First pass: mark correct letters
-    for i, (guess_letter, target_letter) in enumerate(zip(guess_letters, target_letters)):
+    states = []
+    for guess_letter, target_letter in zip(guess, target):
         if guess_letter == target_letter:
-            tiles.append(Tile(pos=i + 1, letter=guess_letter, state="correct"))
-            target_letters[i] = None  # Mark as used
+            states.append("correct")
+            counts[ord(guess_letter) - 97] -= 1
         else:
-            tiles.append(Tile(pos=i + 1, letter=guess_letter, state="absent"))
-
-    # Second pass: mark present letters (but not in correct position)
-    for i, tile in enumerate(tiles):
-        if tile.state == "absent":
-            guess_letter = tile.letter
-            if guess_letter in target_letters:
-                tile.state = "present"
-                # Remove the first occurrence from target_letters
-                target_letters[target_letters.index(guess_letter)] = None
-
-    return tiles
+            states.append(None)
+
+    # Second pass: mark present letters (but not in correct position), otherwise absent
+    for i, state in enumerate(states):
+        if state is None:
+            idx = ord(guess[i]) - 97
+            if counts[idx] > 0:
+                states[i] = "present"
+                counts[idx] -= 1
+            else:
+                states[i] = "absent"
+
+    return [Tile(pos=i + 1, letter=guess[i], state=state) for i, state in enumerate(states)]
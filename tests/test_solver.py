@@ -0,0 +1,216 @@
+"""Tests for the solver module."""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from src.solver import (
+    WORDLE_WORDS,
+    Guess,
+    GuessNumber,
+    Tile,
+    WordleState,
+    _evaluate_guess,
+    filter_possible_words,
+    parse_wordle_tiles,
+    solve_wordle_for_target,
+)
+
+BOARD_HTML = (Path(__file__).parent / "data" / "wordle_board.html").read_text(encoding="utf-8")
+
+
+def _row(wordle_state: WordleState, guess_num: GuessNumber) -> list[tuple[int, str, str]] | None:
+    tiles = wordle_state.get_guess(guess_num)
+    return None if tiles is None else [(tile.pos, tile.letter, tile.state) for tile in tiles]
+
+
+def test_parse_wordle_tiles_reads_board_rows():
+    """Test that scored rows are parsed and modal example tiles are ignored."""
+    wordle_state = parse_wordle_tiles(BOARD_HTML, WordleState())
+
+    assert _row(wordle_state, GuessNumber.FIRST) == [
+        (1, "t", "absent"),
+        (2, "r", "present"),
+        (3, "a", "correct"),
+        (4, "c", "absent"),
+        (5, "e", "absent"),
+    ]
+    assert _row(wordle_state, GuessNumber.SECOND) == [
+        (1, "s", "absent"),
+        (2, "p", "absent"),
+        (3, "a", "correct"),
+        (4, "r", "correct"),
+        (5, "k", "correct"),
+    ]
+    assert _row(wordle_state, GuessNumber.THIRD) == [(1, "b", "tbd")]
+    assert wordle_state.num_guesses == 3
+
+
+def test_parse_wordle_tiles_start_row_skips_earlier_rows():
+    """Test that rows before start_row are left untouched."""
+    wordle_state = parse_wordle_tiles(BOARD_HTML, WordleState(), start_row=1)
+
+    assert wordle_state.get_guess(GuessNumber.FIRST) is None
+    assert _row(wordle_state, GuessNumber.SECOND)[0] == (1, "s", "absent")
+
+
+def test_parse_wordle_tiles_tolerates_whitespace_and_child_elements():
+    """Test that tile letters are read even when wrapped in whitespace or child elements."""
+    html = BOARD_HTML.replace('data-testid="tile">t</div>', 'data-testid="tile">\n  <span>T</span>\n</div>')
+
+    wordle_state = parse_wordle_tiles(html, WordleState())
+
+    assert wordle_state.get_guess(GuessNumber.FIRST)[0] == Tile(pos=1, letter="t", state="absent")
+    assert _row(wordle_state, GuessNumber.SECOND)[4] == (5, "k", "correct")
+
+
+def test_parse_wordle_tiles_ignores_tiles_outside_board():
+    """Test that extra tiles after the sixth row do not spill into a seventh guess."""
+    extra_tiles = '<div data-state="absent" data-testid="tile">x</div>' * 5
+    html = BOARD_HTML.replace("</body>", f'<div class="Row-module_row__pwpBq">{extra_tiles}</div></body>')
+
+    wordle_state = parse_wordle_tiles(html, WordleState())
+
+    assert wordle_state.num_guesses == 3
+
+
+def test_wordle_state_constructor_guesses_are_filtered():
+    """Test that guesses passed to the constructor are used by the filter like set_guess ones."""
+    tiles = _evaluate_guess("trace", "caper")
+    from_set_guess = WordleState()
+    from_set_guess.set_guess(GuessNumber.FIRST, tiles)
+
+    from_constructor = WordleState(guesses={num: None for num in GuessNumber} | {GuessNumber.FIRST: tiles})
+
+    assert from_constructor.num_guesses == 1
+    assert filter_possible_words(from_constructor) == filter_possible_words(from_set_guess)
+
+
+def test_guess_is_hashable():
+    """Test that the frozen Guess can be hashed."""
+    guess = Guess.from_tiles(_evaluate_guess("trace", "caper"))
+
+    assert hash(guess) == hash(Guess.from_tiles(_evaluate_guess("trace", "caper")))
+
+
+def test_wordle_state_solved_tracks_overwritten_rows():
+    """Test that solved follows the constructor input and rows being cleared or overwritten."""
+    solved_tiles = _evaluate_guess("trace", "trace")
+    wordle_state = WordleState(
+        guesses={num: None for num in GuessNumber} | {GuessNumber.SECOND: solved_tiles}
+    )
+    assert wordle_state.solved
+
+    wordle_state.set_guess(GuessNumber.SECOND, _evaluate_guess("crate", "trace"))
+    assert wordle_state.unsolved
+
+    wordle_state.set_guess(GuessNumber.THIRD, solved_tiles)
+    wordle_state.set_guess(GuessNumber.THIRD, None)
+    assert wordle_state.unsolved
+
+
+def test_solve_wordle_for_target_ignores_case():
+    """Test that target and first guess are case-insensitive."""
+    wordle_state = solve_wordle_for_target("CRANE", first_guess="Trace")
+
+    assert wordle_state.get_guess(GuessNumber.FIRST) == _evaluate_guess("trace", "crane")
+    assert wordle_state.solved
+
+
+@pytest.mark.parametrize("target_word,first_guess", [("cr4ne", "trace"), ("crane", "tr-ce")])
+def test_solve_wordle_for_target_rejects_non_letters(target_word: str, first_guess: str):
+    """Test that words with characters outside a-z are rejected up front."""
+    with pytest.raises(ValueError, match="letters a-z"):
+        solve_wordle_for_target(target_word, first_guess=first_guess)
+
+
+_STATE_CODES = {"c": "correct", "p": "present", "a": "absent"}
+
+
+def _tiles(word: str, codes: str) -> list[Tile]:
+    """Build tiles for `word` from one state code per letter (c=correct, p=present, a=absent)."""
+    return [
+        Tile(pos=i + 1, letter=letter, state=_STATE_CODES[code])
+        for i, (letter, code) in enumerate(zip(word, codes))
+    ]
+
+
+def _reference_candidates(guesses: list[list[Tile]]) -> pd.DataFrame:
+    """Candidates selected by the original per-word predicate, in word list order."""
+    correct_pos, present_letters, absent_letters, wrong_pos, guessed_words = {}, set(), set(), {}, set()
+    for guess in guesses:
+        guessed_words.add("".join(tile.letter for tile in guess))
+        for tile in guess:
+            if tile.state == "correct":
+                correct_pos[tile.pos - 1] = tile.letter
+            elif tile.state == "present":
+                present_letters.add(tile.letter)
+                wrong_pos.setdefault(tile.letter, set()).add(tile.pos - 1)
+            elif tile.state == "absent":
+                absent_letters.add(tile.letter)
+
+    def is_valid(word: str) -> bool:
+        if word in guessed_words or any(word[pos] != letter for pos, letter in correct_pos.items()):
+            return False
+        for letter, bad_positions in wrong_pos.items():
+            if letter not in word or any(word[pos] == letter for pos in bad_positions):
+                return False
+        required_letters = present_letters | set(correct_pos.values())
+        return not any(letter in word for letter in absent_letters - required_letters)
+
+    return WORDLE_WORDS[WORDLE_WORDS["word"].map(is_valid)]
+
+
+@pytest.mark.parametrize(
+    "guesses",
+    [
+        # "e" is present in "trace" but the second "e" of "sheep" is absent
+        [_tiles("trace", "aaaap"), _tiles("sheep", "aapaa")],
+        # "r" is present at a different wrong position in each guess
+        [_tiles("trace", "apaaa"), _tiles("burns", "aapaa")],
+        # Mix of correct, present and absent letters from real feedback
+        [_evaluate_guess("trace", "caper"), _evaluate_guess("spare", "caper")],
+    ],
+)
+def test_filter_possible_words_matches_reference(guesses: list[list[Tile]]):
+    """Test that the vectorized filter selects the same candidates as the per-word predicate."""
+    wordle_state = WordleState()
+    for guess_num, tiles in zip(GuessNumber, guesses):
+        wordle_state.set_guess(guess_num, tiles)
+    expected = _reference_candidates(guesses)
+
+    num_words, best_word = filter_possible_words(wordle_state)
+
+    assert num_words == len(expected) > 0
+    top_words = expected[expected["frequency"] == expected["frequency"].max()]
+    assert best_word == top_words["word"].iloc[0]
+
+
+def test_filter_possible_words_breaks_frequency_ties_by_word_list_order():
+    """Test that among equally frequent candidates the first in the word list is chosen."""
+    guesses = [_evaluate_guess("trace", "dials"), _evaluate_guess("sloop", "dials")]
+    wordle_state = WordleState()
+    for guess_num, tiles in zip(GuessNumber, guesses):
+        wordle_state.set_guess(guess_num, tiles)
+    expected = _reference_candidates(guesses)
+    top_words = expected[expected["frequency"] == expected["frequency"].max()]
+    assert list(top_words["word"]) == ["dials", "vials"]
+
+    assert filter_possible_words(wordle_state) == (len(expected), "dials")
+
+
+@pytest.mark.parametrize(
+    "guess,target,codes",
+    [
+        # One "e" in the target: the first misplaced "e" is present, the second absent
+        ("speed", "abide", "aapap"),
+        # The exact-match "e" is counted first, leaving one "e" for the first misplaced one
+        ("eerie", "there", "papac"),
+        # Two "l"s in the target cover both misplaced "l"s
+        ("llama", "hello", "ppaaa"),
+    ],
+)
+def test_evaluate_guess_duplicate_letters(guess: str, target: str, codes: str):
+    """Test present/absent scoring when the guess repeats a letter."""
+    assert _evaluate_guess(guess, target) == _tiles(guess, codes)